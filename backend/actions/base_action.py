@@ -3,7 +3,9 @@
 from abc import ABC, abstractmethod
 from enum import Enum, auto
 from typing import TYPE_CHECKING
-import uuid
+import logging
+import os
+import random
 
 # This is a common pattern to avoid circular imports.
 # The engine needs to know about actions, and actions need to know about the engine's components.
@@ -11,6 +13,18 @@ if TYPE_CHECKING:
     from backend.simulation.state_manager import StateManager
     from backend.simulation.event_bus import EventBus
 
+logger = logging.getLogger(__name__)
+
+# Action IDs only need to be unique within a run, not cryptographically strong.
+# A private PRNG seeded once from os.urandom avoids a urandom read per action,
+# and being separate from the module-level `random` it never perturbs seeded runs.
+_id_rng = random.Random(os.urandom(32))
+
+def _fast_uuid() -> str:
+    """Returns a random 128-bit ID formatted like a UUID string."""
+    h = f"{_id_rng.getrandbits(128):032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
 class Team(Enum):
     RED = auto()
     BLUE = auto()
@@ -28,7 +42,7 @@ class BaseAction(ABC):
                  duration: float,
                  resource_cost: float):
         
-        self.action_id = str(uuid.uuid4()) # A unique ID for this specific action instance
+        self.action_id = _fast_uuid() # A unique ID for this specific action instance
         self._state_manager = state_manager
         self._event_bus = event_bus
         
@@ -69,7 +83,7 @@ class BaseAction(ABC):
         This is the callback function that the TimeManager will execute.
         It orchestrates the action's conclusion. This method is NOT abstract.
         """
-        print(f"\nACTION: Completing action {self.__class__.__name__} on {self.target_node_id}")
+        logger.debug("ACTION: Completing action %s on %s", self.__class__.__name__, self.target_node_id)
         
         if self.execute_logic():
             self.apply_effects_on_success()
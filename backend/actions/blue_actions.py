@@ -1,6 +1,5 @@
 # backend/actions/blue_actions.py
 
-import random
 from .base_action import BaseAction, Team
 from typing import TYPE_CHECKING
 
@@ -30,7 +29,7 @@ class VulnerabilityScan(BaseAction):
         An internal scan is very likely to succeed, but we can add a small
         chance of failure to represent misconfigurations or complex environments.
         """
-        return random.random() < 0.95 # 95% chance of success
+        return self._state_manager.rng.random() < 0.95 # 95% chance of success
 
     def apply_effects_on_success(self):
         """
@@ -45,11 +44,12 @@ class VulnerabilityScan(BaseAction):
         for vuln in target_node.vulnerabilities:
             if not vuln.known_to_blue:
                 # Let's say the scan finds 70% of unknown vulnerabilities
-                if random.random() < 0.70:
+                if self._state_manager.rng.random() < 0.70:
                     vuln.known_to_blue = True
                     newly_discovered_vulns.append(vuln.cve_id)
         
         if newly_discovered_vulns:
+            target_node.mark_dirty()
             print(f"SUCCESS: {self.name} on {target_node.name} discovered new vulnerabilities: {newly_discovered_vulns}")
             self._event_bus.publish(
                 "BLUE_TEAM_VULN_DISCOVERED",
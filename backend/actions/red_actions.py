@@ -1,6 +1,5 @@
 # backend/actions/red_actions.py
 
-import random
 from .base_action import BaseAction, Team
 from typing import TYPE_CHECKING
 
@@ -37,12 +36,12 @@ class PortScan(BaseAction):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         if not node:
             return False
-        return random.random() < (1.0 - node.security_posture_score + 0.2)
+        return self._state_manager.rng.random() < (1.0 - node.security_posture_score + 0.2)
 
     def apply_effects_on_success(self):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.PORT_SCANNED
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.PORT_SCANNED)
         self._state_manager.port_scanned_nodes.add(self.target_node_id)
 
         services = [s.id for s in node.services_running]
@@ -91,12 +90,12 @@ class ServiceFingerprint(BaseAction):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         if not node:
             return False
-        return random.random() < (1.0 - node.security_posture_score + 0.3)
+        return self._state_manager.rng.random() < (1.0 - node.security_posture_score + 0.3)
 
     def apply_effects_on_success(self):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.SERVICE_FINGERPRINTED
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.SERVICE_FINGERPRINTED)
         self._state_manager.fingerprinted_nodes.add(self.target_node_id)
 
         vulns = [v.cve_id for v in node.vulnerabilities]
@@ -149,13 +148,12 @@ class ExploitPublicFacingApp(BaseAction):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         if not node:
             return False
-        best = max(node.vulnerabilities, key=lambda v: v.exploitability)
-        return random.random() < best.exploitability
+        best_exploitability = max(v.exploitability for v in node.vulnerabilities)
+        return self._state_manager.rng.random() < best_exploitability
 
     def apply_effects_on_success(self):
-        node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.INITIAL_ACCESS_GAINED
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.INITIAL_ACCESS_GAINED)
         self._state_manager.initial_access_nodes.add(self.target_node_id)
         self._state_manager.record_kill_chain_event(
             "Initial Access", "ExploitPublicFacingApp", self.target_node_id,
@@ -201,12 +199,11 @@ class PhishingEmail(BaseAction):
         base = 0.5
         if node.security_posture_score > 0.7:
             base -= 0.2
-        return random.random() < base
+        return self._state_manager.rng.random() < base
 
     def apply_effects_on_success(self):
-        node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.INITIAL_ACCESS_GAINED
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.INITIAL_ACCESS_GAINED)
         self._state_manager.initial_access_nodes.add(self.target_node_id)
         self._state_manager.record_kill_chain_event(
             "Initial Access", "PhishingEmail", self.target_node_id,
@@ -253,12 +250,11 @@ class ExploitSUID(BaseAction):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         if not node:
             return False
-        return random.random() < (0.6 - node.security_posture_score * 0.3)
+        return self._state_manager.rng.random() < (0.6 - node.security_posture_score * 0.3)
 
     def apply_effects_on_success(self):
-        node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.PRIVILEGED_ACCESS
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.PRIVILEGED_ACCESS)
         self._state_manager.privileged_nodes.add(self.target_node_id)
         self._state_manager.record_kill_chain_event(
             "Privilege Escalation", "ExploitSUID", self.target_node_id,
@@ -301,12 +297,11 @@ class TokenImpersonation(BaseAction):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         if not node:
             return False
-        return random.random() < 0.65
+        return self._state_manager.rng.random() < 0.65
 
     def apply_effects_on_success(self):
-        node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.PRIVILEGED_ACCESS
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.PRIVILEGED_ACCESS)
         self._state_manager.privileged_nodes.add(self.target_node_id)
         self._state_manager.record_kill_chain_event(
             "Privilege Escalation", "TokenImpersonation", self.target_node_id,
@@ -352,12 +347,11 @@ class DumpCredentials(BaseAction):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         if not node:
             return False
-        return random.random() < 0.80
+        return self._state_manager.rng.random() < 0.80
 
     def apply_effects_on_success(self):
-        node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.CREDENTIALS_DUMPED
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.CREDENTIALS_DUMPED)
 
         creds = [f"hash_{self.target_node_id}_admin", f"hash_{self.target_node_id}_svc"]
         self._state_manager.credential_stores[self.target_node_id] = creds
@@ -402,12 +396,11 @@ class Kerberoasting(BaseAction):
         return True, ""
 
     def execute_logic(self) -> bool:
-        return random.random() < 0.70
+        return self._state_manager.rng.random() < 0.70
 
     def apply_effects_on_success(self):
-        node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.CREDENTIALS_DUMPED
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.CREDENTIALS_DUMPED)
 
         creds = [f"kerb_{self.target_node_id}_svc"]
         self._state_manager.credential_stores[self.target_node_id] = creds
@@ -452,9 +445,7 @@ class PassTheHashMove(BaseAction):
         target = state_manager.network_graph.get_node_by_id(target_node_id)
         if not target or not target.smb_enabled:
             return False, "Target does not have SMB enabled."
-        neighbors = state_manager.network_graph.get_neighbors(source_node_id)
-        neighbor_ids = [n.id for n in neighbors]
-        if target_node_id not in neighbor_ids:
+        if not state_manager.network_graph.are_adjacent(source_node_id, target_node_id):
             return False, "Target is not adjacent to source."
         return True, ""
 
@@ -462,12 +453,11 @@ class PassTheHashMove(BaseAction):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         if not node:
             return False
-        return random.random() < (0.75 - node.security_posture_score * 0.2)
+        return self._state_manager.rng.random() < (0.75 - node.security_posture_score * 0.2)
 
     def apply_effects_on_success(self):
-        node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.LATERAL_ACCESS
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.LATERAL_ACCESS)
         self._state_manager.lateral_access_nodes.add(self.target_node_id)
         self._state_manager.record_kill_chain_event(
             "Lateral Movement", "PassTheHashMove", self.target_node_id,
@@ -508,9 +498,7 @@ class RDPLateralMove(BaseAction):
         target = state_manager.network_graph.get_node_by_id(target_node_id)
         if not target or not target.rdp_enabled:
             return False, "Target does not have RDP enabled."
-        neighbors = state_manager.network_graph.get_neighbors(source_node_id)
-        neighbor_ids = [n.id for n in neighbors]
-        if target_node_id not in neighbor_ids:
+        if not state_manager.network_graph.are_adjacent(source_node_id, target_node_id):
             return False, "Target is not adjacent to source."
         return True, ""
 
@@ -518,12 +506,11 @@ class RDPLateralMove(BaseAction):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         if not node:
             return False
-        return random.random() < (0.70 - node.security_posture_score * 0.2)
+        return self._state_manager.rng.random() < (0.70 - node.security_posture_score * 0.2)
 
     def apply_effects_on_success(self):
-        node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.LATERAL_ACCESS
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.LATERAL_ACCESS)
         self._state_manager.lateral_access_nodes.add(self.target_node_id)
         self._state_manager.record_kill_chain_event(
             "Lateral Movement", "RDPLateralMove", self.target_node_id,
@@ -566,14 +553,14 @@ class ClearEventLogs(BaseAction):
         return True, ""
 
     def execute_logic(self) -> bool:
-        return random.random() < 0.90
+        return self._state_manager.rng.random() < 0.90
 
     def apply_effects_on_success(self):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.EVASION_ACTIVE
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.EVASION_ACTIVE)
         self._state_manager.evasion_active_nodes.add(self.target_node_id)
-        node.detection_chance_modifier = max(0.02, node.detection_chance_modifier - 0.3)
+        self._state_manager.update_node_attribute(self.target_node_id, "detection_chance_modifier", max(0.02, node.detection_chance_modifier - 0.3))
         self._state_manager.record_kill_chain_event(
             "Defense Evasion", "ClearEventLogs", self.target_node_id,
             "Logs wiped — detection chance reduced"
@@ -614,14 +601,14 @@ class DisableAV(BaseAction):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         if not node:
             return False
-        return random.random() < (0.7 - node.security_posture_score * 0.3)
+        return self._state_manager.rng.random() < (0.7 - node.security_posture_score * 0.3)
 
     def apply_effects_on_success(self):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.EVASION_ACTIVE
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.EVASION_ACTIVE)
         self._state_manager.evasion_active_nodes.add(self.target_node_id)
-        node.detection_chance_modifier = max(0.02, node.detection_chance_modifier - 0.4)
+        self._state_manager.update_node_attribute(self.target_node_id, "detection_chance_modifier", max(0.02, node.detection_chance_modifier - 0.4))
         self._state_manager.record_kill_chain_event(
             "Defense Evasion", "DisableAV", self.target_node_id,
             "AV disabled — significantly reduced detection"
@@ -668,12 +655,11 @@ class EstablishC2(BaseAction):
         if not node:
             return False
         bonus = 0.15 if self.target_node_id in self._state_manager.evasion_active_nodes else 0.0
-        return random.random() < (0.65 + bonus)
+        return self._state_manager.rng.random() < (0.65 + bonus)
 
     def apply_effects_on_success(self):
-        node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.C2_ESTABLISHED
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.C2_ESTABLISHED)
         self._state_manager.c2_nodes.add(self.target_node_id)
         self._state_manager.record_kill_chain_event(
             "Command and Control", "EstablishC2", self.target_node_id,
@@ -717,7 +703,7 @@ class C2BeaconKeepAlive(BaseAction):
         resource_gain = node.c2_resource_generation_rate if node else 2.0
         if resource_gain <= 0:
             resource_gain = 2.0
-        self._state_manager.red_resources += resource_gain
+        self._state_manager.add_resources(Team.RED, resource_gain)
         self._state_manager.record_kill_chain_event(
             "Command and Control", "C2BeaconKeepAlive", self.target_node_id,
             f"Beacon OK — +{resource_gain:.1f} resources"
@@ -757,12 +743,12 @@ class StageData(BaseAction):
         return True, ""
 
     def execute_logic(self) -> bool:
-        return random.random() < 0.85
+        return self._state_manager.rng.random() < 0.85
 
     def apply_effects_on_success(self):
         node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.DATA_STAGED
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.DATA_STAGED)
         self._state_manager.staged_data_nodes.add(self.target_node_id)
         self._state_manager.record_kill_chain_event(
             "Exfiltration", "StageData", self.target_node_id,
@@ -802,12 +788,11 @@ class ExfilOverHTTPS(BaseAction):
         if not node:
             return False
         bonus = 0.15 if self.target_node_id in self._state_manager.evasion_active_nodes else 0.0
-        return random.random() < (0.60 + bonus)
+        return self._state_manager.rng.random() < (0.60 + bonus)
 
     def apply_effects_on_success(self):
-        node = self._state_manager.network_graph.get_node_by_id(self.target_node_id)
         from backend.simulation.objects.node import NodeStatus
-        node.current_status = NodeStatus.DATA_EXFILTRATED
+        self._state_manager.update_node_attribute(self.target_node_id, "current_status", NodeStatus.DATA_EXFILTRATED)
         self._state_manager.exfil_complete = True
         self._state_manager.record_kill_chain_event(
             "Exfiltration", "ExfilOverHTTPS", self.target_node_id,
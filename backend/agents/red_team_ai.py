@@ -15,7 +15,7 @@ On each tick the AI:
      and transitions to the next state when conditions are met.
 """
 
-import random
+from collections import deque
 from enum import Enum, auto
 from .base_agent import BaseAgent
 from backend.actions.base_action import Team
@@ -59,7 +59,7 @@ class RedTeamAI(BaseAgent):
         self._cooldown = 0
 
         # Queues populated by scanning results
-        self._recon_queue: list[str] = []        # nodes yet to port-scan
+        self._recon_queue: deque[str] = deque()  # nodes yet to port-scan
         self._fingerprint_queue: list[str] = []  # nodes yet to fingerprint
         self._initial_access_candidates: list[str] = []
         self._lateral_targets: list[str] = []
@@ -74,15 +74,25 @@ class RedTeamAI(BaseAgent):
     # ------------------------------------------------------------------
     def _initialize_queues(self):
         """Fill the recon queue with all node IDs, shuffled."""
-        all_ids = list(self._state_manager.network_graph.graph.nodes())
-        random.shuffle(all_ids)
-        self._recon_queue = all_ids[:]
+        all_ids = [node.id for node in self._state_manager.network_graph.get_all_nodes()]
+        self._state_manager.rng.shuffle(all_ids)
+        # Sized once from the scenario's node count; consumed from the left.
+        self._recon_queue = deque(all_ids)
         print(f"RED_AI: Recon queue loaded with {len(self._recon_queue)} targets")
 
     def _subscribe_events(self):
-        self._event_bus.subscribe("ACTION_COMPLETED", self._on_action_completed)
-        self._event_bus.subscribe("ACTION_SUCCESS", self._on_action_success)
-        self._event_bus.subscribe("ACTION_FAILURE", self._on_action_failure)
+        self._subscriptions = (
+            ("ACTION_COMPLETED", self._on_action_completed),
+            ("ACTION_SUCCESS", self._on_action_success),
+            ("ACTION_FAILURE", self._on_action_failure),
+        )
+        for event_type, handler in self._subscriptions:
+            self._event_bus.subscribe(event_type, handler)
+
+    def detach(self):
+        """Unsubscribes this agent from the EventBus. Call before replacing it."""
+        for event_type, handler in self._subscriptions:
+            self._event_bus.unsubscribe(event_type, handler)
 
     # ------------------------------------------------------------------
     # Event handlers
@@ -170,18 +180,22 @@ class RedTeamAI(BaseAgent):
     def _build_lateral_targets(self):
         """Find neighbors of owned nodes that are not yet owned."""
         owned = self._state_manager.get_owned_nodes()
-        targets = set()
-        for nid in owned:
-            for neighbor in self._state_manager.network_graph.get_neighbors(nid):
-                if neighbor.id not in owned:
-                    targets.add(neighbor.id)
-        self._lateral_targets = list(targets)
-        random.shuffle(self._lateral_targets)
+        targets = self._state_manager.network_graph.get_frontier(owned)
+        # Sorted before the shuffle for the same reason as in _decide_priv_esc.
+        self._lateral_targets = sorted(targets)
+        self._state_manager.rng.shuffle(self._lateral_targets)
         print(f"RED_AI: Built lateral target list: {self._lateral_targets}")
 
     # ------------------------------------------------------------------
     # Main decision loop (called every tick by the engine)
     # ------------------------------------------------------------------
+    def needs_tick(self) -> bool:
+        """
+        True while the FSM is waiting to pick its next action (idle or cooling
+        down). While busy, nothing changes until the in-flight action's event fires.
+        """
+        return not self._is_busy and self._state != KillChainState.DONE
+
     def decide_actions(self):
         if self._is_busy or self._state == KillChainState.DONE:
             return
@@ -248,7 +262,7 @@ class RedTeamAI(BaseAgent):
 
         # Otherwise port-scan the next target
         while self._recon_queue:
-            nid = self._recon_queue.pop(0)
+            nid = self._recon_queue.popleft()
             ok, _ = PortScan.check_preconditions(sm, nid)
             if ok:
                 print(f"RED_AI [RECON]: Port-scanning {nid}")
@@ -271,7 +285,7 @@ class RedTeamAI(BaseAgent):
 
         # Fallback: phishing on any Workstation / Server
         all_nodes = sm.network_graph.get_all_nodes()
-        random.shuffle(all_nodes)
+        sm.rng.shuffle(all_nodes)
         for node in all_nodes:
             ok, _ = PhishingEmail.check_preconditions(sm, node.id)
             if ok:
@@ -283,14 +297,17 @@ class RedTeamAI(BaseAgent):
     def _decide_priv_esc(self):
         sm = self._state_manager
         # Try TokenImpersonation first (requires has_admin_users)
-        for nid in sm.initial_access_nodes | sm.lateral_access_nodes:
+        # Sets are walked in sorted order so a seeded run picks the same
+        # nodes regardless of string hash randomization.
+        footholds = sorted(sm.initial_access_nodes | sm.lateral_access_nodes)
+        for nid in footholds:
             ok, _ = TokenImpersonation.check_preconditions(sm, nid)
             if ok:
                 print(f"RED_AI [PRIV_ESC]: Token impersonation on {nid}")
                 return TokenImpersonation(sm, self._event_bus, nid)
 
         # Fallback to ExploitSUID
-        for nid in sm.initial_access_nodes | sm.lateral_access_nodes:
+        for nid in footholds:
             ok, _ = ExploitSUID.check_preconditions(sm, nid)
             if ok:
                 print(f"RED_AI [PRIV_ESC]: SUID exploit on {nid}")
@@ -300,7 +317,7 @@ class RedTeamAI(BaseAgent):
 
     def _decide_cred_access(self):
         sm = self._state_manager
-        for nid in list(sm.privileged_nodes):
+        for nid in sorted(sm.privileged_nodes):
             # Prefer Kerberoasting on nodes with admin users
             ok, _ = Kerberoasting.check_preconditions(sm, nid)
             if ok:
@@ -319,7 +336,7 @@ class RedTeamAI(BaseAgent):
         self._build_lateral_targets()
 
         # Find a source node that has dumped creds
-        source_nodes = [nid for nid in sm.credential_stores]
+        source_nodes = sorted(sm.credential_stores)
 
         for target_id in list(self._lateral_targets):
             for source_id in source_nodes:
@@ -345,7 +362,7 @@ class RedTeamAI(BaseAgent):
         sm = self._state_manager
         # Run evasion on every privileged + lateral node
         candidates = (sm.privileged_nodes | sm.lateral_access_nodes) - sm.evasion_active_nodes
-        for nid in candidates:
+        for nid in sorted(candidates):
             ok, _ = ClearEventLogs.check_preconditions(sm, nid)
             if ok:
                 print(f"RED_AI [EVASION]: Clearing logs on {nid}")
@@ -365,14 +382,14 @@ class RedTeamAI(BaseAgent):
     def _decide_c2(self):
         sm = self._state_manager
         owned = sm.get_owned_nodes() - sm.c2_nodes
-        for nid in owned:
+        for nid in sorted(owned):
             ok, _ = EstablishC2.check_preconditions(sm, nid)
             if ok:
                 print(f"RED_AI [C2]: Establishing C2 on {nid}")
                 return EstablishC2(sm, self._event_bus, nid)
 
         # Keep-alive on existing C2 nodes to generate resources
-        for nid in list(sm.c2_nodes):
+        for nid in sorted(sm.c2_nodes):
             ok, _ = C2BeaconKeepAlive.check_preconditions(sm, nid)
             if ok:
                 print(f"RED_AI [C2]: Keep-alive beacon on {nid}")
@@ -384,14 +401,14 @@ class RedTeamAI(BaseAgent):
         sm = self._state_manager
 
         # Stage data first
-        for nid in list(sm.c2_nodes):
+        for nid in sorted(sm.c2_nodes):
             ok, _ = StageData.check_preconditions(sm, nid)
             if ok:
                 print(f"RED_AI [EXFIL]: Staging data on {nid}")
                 return StageData(sm, self._event_bus, nid)
 
         # Then exfil
-        for nid in list(sm.staged_data_nodes):
+        for nid in sorted(sm.staged_data_nodes):
             ok, _ = ExfilOverHTTPS.check_preconditions(sm, nid)
             if ok:
                 print(f"RED_AI [EXFIL]: Exfiltrating over HTTPS from {nid}")
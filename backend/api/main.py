@@ -3,29 +3,38 @@
 import sys
 import os
 import asyncio
-import json
 from enum import Enum
 from typing import Set
 
+import orjson
+
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from backend.simulation.engine import SimulationEngine
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 
 
 # ---------------------------------------------------------------------------
-# Custom JSON encoder — handles Enums, sets, and anything else non-serializable
+# orjson fallback — handles sets and anything else orjson can't serialize.
+# orjson encodes Enums natively *by value*, so every to_dict() converts its
+# Enums to names before they get here.
 # ---------------------------------------------------------------------------
-class SimulationEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Enum):
-            return obj.name
-        if isinstance(obj, set):
-            return list(obj)
-        return super().default(obj)
+def _orjson_default(obj):
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Enum):
+        return obj.name
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class _ORJSONResponse(JSONResponse):
+    """Default response class: renders HTTP bodies with orjson, like the WebSocket."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_orjson_default)
 
 
 # ---------------------------------------------------------------------------
@@ -74,6 +83,7 @@ app = FastAPI(
     title="OmniSec Cyber Conflict Simulation API",
     description="API for managing and interacting with the OmniSec simulation.",
     version="0.2.0",
+    default_response_class=_ORJSONResponse,
 )
 
 
@@ -110,7 +120,8 @@ async def state_broadcaster():
                 snapshot = simulation_engine.state_manager.to_dict(
                     simulation_engine.time_manager.current_time
                 )
-                await manager.broadcast(json.dumps(snapshot, cls=SimulationEncoder))
+                payload = orjson.dumps(snapshot, default=_orjson_default)
+                await manager.broadcast(payload.decode())
             except Exception as e:
                 print(f"WS: Error building/broadcasting snapshot: {e}")
 
@@ -139,9 +150,9 @@ async def pause_simulation():
     return {"message": "Simulation pause command sent to engine."}
 
 @app.post("/api/simulation/reset/{scenario_name}")
-async def reset_simulation(scenario_name: str):
+async def reset_simulation(scenario_name: str, seed: int | None = None):
     path = os.path.join(PROJECT_ROOT, "backend", "scenarios", f"{scenario_name}.json")
-    simulation_engine.reset_simulation(path)
+    simulation_engine.reset_simulation(path, seed)
     return {"message": f"Simulation reset command sent to engine for scenario '{scenario_name}'."}
 
 @app.post("/api/simulation/speed/{factor}")
@@ -180,6 +191,20 @@ async def get_node_statuses():
         }
     }
 
+@app.get("/api/state/tick")
+async def get_state_tick(since: int = 0):
+    """
+    Returns the dynamic fields of the nodes that changed after version `since`.
+    Pass the returned version back on the next call to get only new changes;
+    static node data comes from the full WebSocket snapshot.
+    """
+    version, nodes = simulation_engine.state_manager.node_changes_since(since)
+    return {
+        "sim_time": simulation_engine.time_manager.current_time,
+        "version": version,
+        "nodes": nodes,
+    }
+
 @app.get("/api/state/resources")
 async def get_resources():
     """Returns Red and Blue team resource levels."""
@@ -1,4 +1,11 @@
+import logging
 import uvicorn
+
+# Configure logging before the API module builds the simulation engine.
+# Simulation modules log through `logging` so that disabled levels skip
+# message formatting entirely.
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
 from backend.api.main import app as fastapi_app # Import the FastAPI app instance
 
 def run_backend():
@@ -9,6 +16,9 @@ def run_backend():
     print("Starting OmniSec Backend (FastAPI + Uvicorn)...")
     # The 'api.main:app' string tells Uvicorn to look for 'app'
     # inside 'main.py' within the 'api' directory.
+    # Single worker on purpose: the simulation engine and WebSocket clients
+    # live in this process, so extra workers would each run a separate,
+    # diverging simulation. uvicorn[standard] already picks uvloop/httptools.
     uvicorn.run(fastapi_app, host="0.0.0.0", port=8000, reload=False)
 
 if __name__ == "__main__":
@@ -1,13 +1,16 @@
 # backend/simulation/action_executor.py
 
+import logging
 from typing import TYPE_CHECKING
-from ..actions.base_action import BaseAction, Team
+from ..actions.base_action import BaseAction
 
 if TYPE_CHECKING:
     from .state_manager import StateManager
     from .time_manager import TimeManager
     from .event_bus import EventBus
 
+logger = logging.getLogger(__name__)
+
 class ActionExecutor:
     """
     Validates and schedules actions. Supports immediate or absolute start times.
@@ -19,7 +22,7 @@ class ActionExecutor:
         self._state_manager = state_manager
         self._time_manager = time_manager
         self._event_bus = event_bus
-        print("DEBUG: ActionExecutor initialized.")
+        logger.debug("ActionExecutor initialized.")
 
     def execute_action(self, action: BaseAction, start_time: float | None = None):
         """
@@ -36,7 +39,8 @@ class ActionExecutor:
 
         if delay > 0:
             # Schedule the _start_action method to be called in the future.
-            print(f"\nACTION_EXEC: Scheduling {action.name} to START at sim time {start_time:.2f} (in {delay:.2f} minutes).")
+            logger.debug("ACTION_EXEC: Scheduling %s to START at sim time %.2f (in %.2f minutes).",
+                         action.name, start_time, delay)
             self._time_manager.schedule_event(self._start_action, delay, action=action)
         else:
             # Execute immediately.
@@ -47,30 +51,27 @@ class ActionExecutor:
         This private method contains the logic for actually starting an action.
         It is called either immediately by execute_action or later by the TimeManager.
         """
-        print(f"\nACTION_EXEC: Starting {action.name} on {action.target_node_id} at SIM TIME {self._time_manager.current_time:.2f}")
+        logger.debug("ACTION_EXEC: Starting %s on %s at SIM TIME %.2f",
+                     action.name, action.target_node_id, self._time_manager.current_time)
 
-        # 1. Validate resources AT THE TIME OF EXECUTION.
+        # 1 & 2. Validate and deduct resources AT THE TIME OF EXECUTION.
+        # The check and the deduction happen atomically under the team's lock.
         actor_team = action.actor_team
         cost = action.resource_cost
-        
-        current_resources = self._state_manager.red_resources if actor_team == Team.RED else self._state_manager.blue_resources
-        
-        if current_resources < cost:
-            print(f"ACTION_EXEC: FAILED. {actor_team.name} has {current_resources:.1f} resources, but {cost} are required.")
+
+        if not self._state_manager.spend_resources(actor_team, cost):
+            logger.info("ACTION_EXEC: FAILED. %s has %.1f resources, but %s are required.",
+                        actor_team.name, self._state_manager.get_resources(actor_team), cost)
             self._event_bus.publish('ACTION_FAILED', {'reason': 'Insufficient Resources', 'action': action.name})
             return
 
-        # 2. Deduct resources.
-        if actor_team == Team.RED:
-            self._state_manager.red_resources -= cost
-        else:
-            self._state_manager.blue_resources -= cost
-        print(f"ACTION_EXEC: Deducted {cost} from {actor_team.name}. New total: {self._state_manager.red_resources if actor_team == Team.RED else self._state_manager.blue_resources:.1f}")
+        logger.debug("ACTION_EXEC: Deducted %s from %s. New total: %.1f",
+                     cost, actor_team.name, self._state_manager.get_resources(actor_team))
         
         # 3. Schedule the action's completion.
-        completion_time = self._time_manager.current_time + action.duration
         self._time_manager.schedule_event(action.complete, action.duration)
-        print(f"ACTION_EXEC: Scheduled {action.name} to COMPLETE in {action.duration:.2f} sim minutes (at sim time {completion_time:.2f}).")
+        logger.debug("ACTION_EXEC: Scheduled %s to COMPLETE in %.2f sim minutes (at sim time %.2f).",
+                     action.name, action.duration, self._time_manager.current_time + action.duration)
 
         # 4. Publish an event that the action has started.
         self._event_bus.publish('ACTION_INITIATED', {'action': action.name, 'target': action.target_node_id}) 
\ No newline at end of file
@@ -1,5 +1,6 @@
 # backend/simulation/engine.py
 
+import sys
 import time
 import threading
 
@@ -35,10 +36,11 @@ class SimulationEngine:
         """The core loop that drives the simulation forward in time."""
         print("ENGINE_LOOP: Simulation loop thread started.")
         last_real_time = time.time()
+        last_display_time = 0.0
 
         while not self._stop_event.is_set():
             if not self.state_manager.is_running:
-                time.sleep(0.1)
+                self._stop_event.wait(0.1)
                 last_real_time = time.time()
                 continue
             
@@ -58,15 +60,32 @@ class SimulationEngine:
             # if self.blue_team_ai: # This is a placeholder for when we create the Blue AI
             #     self.blue_team_ai.decide_actions()
             
-            # Update the time display
-            print(f"\rSIM TIME: {self.time_manager.current_time:.2f}", end="")
-
-            # Sleep briefly to be CPU-friendly
-            time.sleep(0.01)
+            # Update the time display, at most ~10 times a second
+            if current_real_time - last_display_time >= 0.1:
+                last_display_time = current_real_time
+                sys.stdout.write(f"\rSIM TIME: {self.time_manager.current_time:.2f}")
+                sys.stdout.flush()
+
+            # Sleep until the next scheduled event is due instead of a fixed
+            # tick. An idle AI still gets regular ticks to count down its
+            # cooldown, and the 0.1s cap keeps speed changes and the clock
+            # display responsive.
+            if self.red_team_ai and self.red_team_ai.needs_tick():
+                sleep_for = 0.01
+            else:
+                next_time = self.time_manager.next_event_time()
+                speed = self.time_manager.get_speed()
+                if next_time is None or speed <= 0:
+                    sleep_for = 0.1
+                else:
+                    sleep_for = min(0.1, max(0.0, (next_time - self.time_manager.current_time) / speed))
+            if self._stop_event.wait(sleep_for):
+                break
 
         print("\nENGINE_LOOP: Simulation loop thread has stopped.")
 
     def start_simulation(self):
+        # NetworkGraph defines __len__, so an empty (failed) load is rejected too.
         if not self.state_manager.network_graph:
             print("\nERROR: Cannot start simulation. No scenario loaded.")
             return
@@ -89,19 +108,23 @@ class SimulationEngine:
         self.state_manager.is_running = False
         self.time_manager.pause()
 
-    def reset_simulation(self, scenario_path: str):
+    def reset_simulation(self, scenario_path: str, seed: int | None = None):
         print(f"\nENGINE: Resetting simulation with scenario at '{scenario_path}'...")
         if self._loop_thread and self._loop_thread.is_alive():
             self.state_manager.is_running = False
             self._stop_event.set()
             self._loop_thread.join()
 
-        self.state_manager.reset(scenario_path)
+        self.state_manager.reset(scenario_path, seed)
         self.time_manager.reset()
 
         # --- NEW LINES ARE HERE ---
         # Now that a scenario is loaded into the state, create the AI agent.
         print("ENGINE: Initializing AI agents...")
+        # The engine's EventBus outlives each run, so drop the old agent's
+        # handlers or every reset leaves another stale subscriber behind.
+        if self.red_team_ai:
+            self.red_team_ai.detach()
         self.red_team_ai = RedTeamAI(self.state_manager, self.action_executor, self.event_bus)
         # self.blue_team_ai = BlueTeamAI(...) # Placeholder for later
 
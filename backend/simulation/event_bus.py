@@ -1,6 +1,8 @@
-from collections import defaultdict
+import logging
 from typing import Callable, Any
 
+logger = logging.getLogger(__name__)
+
 # This component of the OmniSec system allows for all of the moving parts of this simulation to communicate with each other. 
 # It works like a PA system. When something happens, that event is published. 
 # Whoever is "subscribed" to those types of events will be notified of it. If they are not subscribed, nothing will happen.
@@ -11,27 +13,39 @@ class EventBus:
     between simulation components.
     """
     def __init__(self):
-        self.subscribers: dict[str, list[Callable]] = defaultdict(list)
+        # Tuples are rebuilt on (un)subscribe, which is rare, so publish can
+        # iterate them directly. A plain dict means publishing an event nobody
+        # listens to doesn't insert an empty entry.
+        self.subscribers: dict[str, tuple[Callable, ...]] = {}
 
     def subscribe(self, event_type: str, callback: Callable):
         """Registers a callback function to be invoked when event_type is published."""
-        self.subscribers[event_type].append(callback)
-        print(f"DEBUG: Subscribed {callback.__name__} to '{event_type}'")
+        self.subscribers[event_type] = self.subscribers.get(event_type, ()) + (callback,)
+        logger.debug("Subscribed %s to '%s'", callback.__name__, event_type)
 
     def unsubscribe(self, event_type: str, callback: Callable):
         """Removes a callback from event_type subscribers."""
-        if callback in self.subscribers[event_type]:
-            self.subscribers[event_type].remove(callback)
-            print(f"DEBUG: Unsubscribed {callback.__name__} from '{event_type}'")
+        subs = self.subscribers.get(event_type, ())
+        if callback in subs:
+            i = subs.index(callback)
+            remaining = subs[:i] + subs[i + 1:]
+            if remaining:
+                self.subscribers[event_type] = remaining
+            else:
+                del self.subscribers[event_type]
+            logger.debug("Unsubscribed %s from '%s'", callback.__name__, event_type)
 
     def publish(self, event_type: str, payload: dict):
         """Notifies all registered subscribers for event_type."""
-        print(f"DEBUG: Publishing event '{event_type}' with payload: {payload}")
-        for callback in self.subscribers[event_type]:
+        subs = self.subscribers.get(event_type)
+        if subs is None:
+            return
+        logger.debug("Publishing event '%s' with payload: %s", event_type, payload)
+        for callback in subs:
             try:
                 callback(event_type, payload)
             except Exception as e:
-                print(f"ERROR: Event handler {callback.__name__} for '{event_type}' failed: {e}")
+                logger.error("Event handler %s for '%s' failed: %s", callback.__name__, event_type, e)
 
 # Global instance of EventBus to be used throughout the simulation
 # This makes it a singleton, accessible everywhere.
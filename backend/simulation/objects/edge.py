@@ -1,8 +1,9 @@
 # backend/simulation/objects/edge.py
 
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Edge:
     """Represents a network connection between two nodes."""
     source_node_id: str
@@ -12,6 +13,17 @@ class Edge:
     # Placeholder for more complex firewall logic
     firewall_rules: dict | None = None
 
+    def __post_init__(self):
+        # Few distinct traffic types; object.__setattr__ since the class is frozen
+        object.__setattr__(self, 'traffic_type', sys.intern(self.traffic_type))
+
     def to_dict(self):
         """Converts the dataclass to a dictionary."""
-        return asdict(self)
\ No newline at end of file
+        # Built by hand: asdict() deep-copies every field value
+        return {
+            "source_node_id": self.source_node_id,
+            "target_node_id": self.target_node_id,
+            "bidirectional": self.bidirectional,
+            "traffic_type": self.traffic_type,
+            "firewall_rules": dict(self.firewall_rules) if self.firewall_rules is not None else None,
+        }
\ No newline at end of file
@@ -1,95 +1,236 @@
-import json
-import networkx as nx
+import os
+import orjson
+from collections import deque
 from typing import List, Tuple, Dict, Any
 from .node import Node
 from .edge import Edge
 
+# Pristine graphs built from scenario files, keyed by path, with the mtime
+# they were read at. Every reset reloads the scenario, so the JSON is parsed
+# and built only once per edit; each load hands out a clone of the template.
+_SCENARIO_CACHE: Dict[str, Tuple[float, 'NetworkGraph']] = {}
+
 class NetworkGraph:
     """
-    Holds the network topology using NetworkX for powerful graph operations.
-    This class acts as a manager and wrapper around a NetworkX graph object,
-    storing our custom Node and Edge objects as node/edge attributes.
+    Holds the network topology as plain adjacency dicts, storing our custom
+    Node and Edge objects directly. Use to_networkx() for offline analysis.
     """
 
     def __init__(self):
-        # Use a DiGraph for directed connections, which is more realistic.
-        # An edge from A to B doesn't automatically mean B can talk to A.
-        self.graph = nx.DiGraph()
+        # Edges are directed, which is more realistic: an edge from A to B
+        # doesn't automatically mean B can talk to A.
+        self._nodes: Dict[str, Node] = {}
+        self._succ: Dict[str, Dict[str, Edge]] = {}  # source -> {target: Edge}, directed
+        self._neighbors: Dict[str, set] = {}  # node_id -> IDs linked in either direction
+
+        # Serialized edge list for to_dict(). Edges are frozen, so it only
+        # changes when the topology does.
+        self._edges_payload: List[dict] | None = None
+
+    def __len__(self) -> int:
+        """Number of nodes, in O(1). An empty graph is falsy."""
+        return len(self._nodes)
 
     def add_node(self, node: Node):
         """Adds a Node object to the graph."""
-        if self.graph.has_node(node.id):
+        if node.id in self._nodes:
             raise ValueError(f"Node with id {node.id} already exists.")
-        # The node's ID is the graph node. The entire Node object is stored
-        # in the 'data' attribute of the graph node.
-        self.graph.add_node(node.id, data=node)
+        self._nodes[node.id] = node
+        self._succ[node.id] = {}
+        self._neighbors[node.id] = set()
 
     def add_edge(self, edge: Edge):
         """Adds an Edge object to the graph."""
-        if not self.graph.has_node(edge.source_node_id):
+        if edge.source_node_id not in self._nodes:
             raise ValueError(f"Source node {edge.source_node_id} not in graph.")
-        if not self.graph.has_node(edge.target_node_id):
+        if edge.target_node_id not in self._nodes:
             raise ValueError(f"Target node {edge.target_node_id} not in graph.")
-        
-        # The entire Edge object is stored in the 'data' attribute of the graph edge.
-        self.graph.add_edge(edge.source_node_id, edge.target_node_id, data=edge)
+
+        # A bidirectional link shares one Edge object between both directions
         if edge.bidirectional:
-            self.graph.add_edge(edge.target_node_id, edge.source_node_id, data=edge)
+            self._succ[edge.target_node_id][edge.source_node_id] = edge
+        self._succ[edge.source_node_id][edge.target_node_id] = edge
+        self._edges_payload = None
+        self._neighbors[edge.source_node_id].add(edge.target_node_id)
+        self._neighbors[edge.target_node_id].add(edge.source_node_id)
+
+    def add_edges(self, edges: List[Edge]):
+        """
+        Adds many Edge objects at once. Validates every endpoint first, then
+        fills the adjacency dicts in a single pass.
+        """
+        nodes = self._nodes
+        for edge in edges:
+            if edge.source_node_id not in nodes:
+                raise ValueError(f"Source node {edge.source_node_id} not in graph.")
+            if edge.target_node_id not in nodes:
+                raise ValueError(f"Target node {edge.target_node_id} not in graph.")
+        succ = self._succ
+        neighbors = self._neighbors
+        for edge in edges:
+            src, dst = edge.source_node_id, edge.target_node_id
+            succ[src][dst] = edge
+            if edge.bidirectional:
+                succ[dst][src] = edge
+            neighbors[src].add(dst)
+            neighbors[dst].add(src)
+        self._edges_payload = None
+
+    def bulk_load(self, nodes_data: List[dict], edges_data: List[dict]):
+        """
+        Builds the topology from raw scenario dicts in one pass. Duplicate
+        node IDs raise ValueError, as add_node does, before anything is
+        stored; edge endpoints are validated by add_edges.
+        """
+        nodes = {nd['id']: Node.from_dict(nd) for nd in nodes_data}
+        # The dict silently keeps the last of any repeated ID, so compare sizes
+        if len(nodes) != len(nodes_data) or not self._nodes.keys().isdisjoint(nodes):
+            seen = set(self._nodes)
+            for nd in nodes_data:
+                if nd['id'] in seen:
+                    raise ValueError(f"Node with id {nd['id']} already exists.")
+                seen.add(nd['id'])
+        self._nodes.update(nodes)
+        self._succ.update((nid, {}) for nid in nodes)
+        self._neighbors.update((nid, set()) for nid in nodes)
+        self.add_edges([Edge(**ed) for ed in edges_data])
+
+    def edge_count(self) -> int:
+        """Number of directed edges; a bidirectional link counts twice."""
+        return sum(len(targets) for targets in self._succ.values())
 
     def get_node_by_id(self, node_id: str) -> Node | None:
         """Retrieves the full Node object by its ID."""
-        if self.graph.has_node(node_id):
-            return self.graph.nodes[node_id]['data']
-        return None
+        return self._nodes.get(node_id)
 
     def get_all_nodes(self) -> List[Node]:
         """Returns a list of all Node objects in the graph."""
-        return [data['data'] for _, data in self.graph.nodes(data=True)]
+        return list(self._nodes.values())
 
     def get_neighbors(self, node_id: str) -> List[Node]:
         """Gets all directly connected neighbor Node objects."""
-        if not self.graph.has_node(node_id):
-            return []
-        # In a DiGraph, successors are nodes that can be reached from node_id.
-        # We also check predecessors for a complete neighbor list.
-        neighbor_ids = set(self.graph.successors(node_id)) | set(self.graph.predecessors(node_id))
-        return [self.get_node_by_id(nid) for nid in neighbor_ids if nid]
+        # Neighbors are nodes reachable from node_id (successors) plus nodes
+        # that can reach it (predecessors), precomputed as one set per node.
+        nodes = self._nodes
+        return [nodes[nid] for nid in self._neighbors.get(node_id, ())]
+
+    def are_adjacent(self, node_a: str, node_b: str) -> bool:
+        """True if an edge exists between the two nodes in either direction."""
+        return node_b in self._neighbors.get(node_a, ())
+
+    def get_frontier(self, node_ids: set) -> set:
+        """
+        Returns the IDs of every node adjacent (in either direction) to any node
+        in node_ids that is not itself in node_ids. Works on IDs only, so no
+        Node objects are materialized while walking the graph.
+        """
+        neighbors = self._neighbors
+        frontier = set()
+        for nid in node_ids:
+            if nid in neighbors:
+                frontier.update(neighbors[nid])
+        frontier.difference_update(node_ids)
+        return frontier
 
     def get_path(self, source_id: str, target_id: str) -> List[Node] | None:
         """Finds the shortest path between two nodes."""
-        try:
-            path_ids = nx.shortest_path(self.graph, source=source_id, target=target_id)
-            return [self.get_node_by_id(pid) for pid in path_ids if pid]
-        except (nx.NetworkXNoPath, nx.NodeNotFound):
+        # Unweighted, so a plain BFS over the successor dicts is enough
+        succ = self._succ
+        if source_id not in succ or target_id not in succ:
+            return None
+        parent = {source_id: None}
+        queue = deque([source_id])
+        while queue:
+            current = queue.popleft()
+            if current == target_id:
+                break
+            for nxt in succ[current]:
+                if nxt not in parent:
+                    parent[nxt] = current
+                    queue.append(nxt)
+        else:
             return None
 
+        nodes = self._nodes
+        path = []
+        step = target_id
+        while step is not None:
+            path.append(nodes[step])
+            step = parent[step]
+        path.reverse()
+        return path
+
     @staticmethod
     def load_from_json(file_path: str) -> 'NetworkGraph':
         """Static method to load a scenario from a JSON file."""
-        graph_manager = NetworkGraph()
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-
-        for node_data in data.get('nodes', []):
-            # We can perform validation or transformation here if needed
-            graph_manager.add_node(Node(**node_data))
-        
-        for edge_data in data.get('edges', []):
-            graph_manager.add_edge(Edge(**edge_data))
-            
-        print(f"DEBUG: Loaded NetworkGraph from {file_path} with {graph_manager.graph.number_of_nodes()} nodes and {graph_manager.graph.number_of_edges()} edges.")
+        mtime = os.path.getmtime(file_path)
+        cached = _SCENARIO_CACHE.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            template = cached[1]
+        else:
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+            template = NetworkGraph()
+            template.bulk_load(data.get('nodes', []), data.get('edges', []))
+            _SCENARIO_CACHE[file_path] = (mtime, template)
+
+        graph_manager = template.clone()
+        print(f"DEBUG: Loaded NetworkGraph from {file_path} with {len(graph_manager)} nodes and {graph_manager.edge_count()} edges.")
         return graph_manager
 
+    def clone(self) -> 'NetworkGraph':
+        """
+        Returns an independent copy ready for a fresh run. Nodes are copied
+        since the simulation mutates them; Edges are frozen and shared.
+        """
+        graph = NetworkGraph()
+        graph._nodes = {nid: node.clone() for nid, node in self._nodes.items()}
+        graph._succ = {nid: dict(targets) for nid, targets in self._succ.items()}
+        graph._neighbors = {nid: set(linked) for nid, linked in self._neighbors.items()}
+        graph._edges_payload = self._edges_payload
+        return graph
+
     def to_dict(self) -> Dict[str, Any]:
-        """Serializes the graph state to a dictionary for API transmission."""
+        """
+        Serializes the graph state to a dictionary for API transmission.
+        The edge list and node dicts are cached, so callers must not mutate them.
+        """
+        if self._edges_payload is None:
+            edges = []
+            for u, targets in self._succ.items():
+                for v, edge in targets.items():
+                    # Edge.to_dict() returns a fresh dict, so add the endpoints to it
+                    # in place instead of unpacking it into yet another dict.
+                    d = edge.to_dict()
+                    d['source'] = u
+                    d['target'] = v
+                    edges.append(d)
+            self._edges_payload = edges
         return {
-            "nodes": [node.to_dict() for node in self.get_all_nodes()],
-            "edges": [
-                {**edge_data['data'].to_dict(), 'source': u, 'target': v} 
-                for u, v, edge_data in self.graph.edges(data=True)
-            ]
+            "nodes": [node.to_dict() for node in self._nodes.values()],
+            "edges": self._edges_payload,
         }
     
+    def to_networkx(self):
+        """
+        Builds a networkx DiGraph copy of the topology for offline analysis,
+        with Node/Edge objects under the 'data' attribute. networkx is not a
+        runtime dependency and is only imported here.
+        """
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from((nid, {'data': node}) for nid, node in self._nodes.items())
+        graph.add_edges_from(
+            (u, v, {'data': edge})
+            for u, targets in self._succ.items()
+            for v, edge in targets.items()
+        )
+        return graph
+
     def reset(self):
         """Clears the graph."""
-        self.graph.clear()
\ No newline at end of file
+        self._nodes.clear()
+        self._succ.clear()
+        self._neighbors.clear()
+        self._edges_payload = None
\ No newline at end of file
@@ -1,6 +1,7 @@
 # backend/simulation/objects/node.py
 
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field, fields, replace, MISSING
 from enum import Enum, auto
 from typing import List
 from .service import Service
@@ -41,7 +42,7 @@ class NodeStatus(Enum):
     ISOLATED_QUARANTINED = auto()   # Blue team cut this node off
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """Represents a single device or system in the network."""
 
@@ -64,19 +65,144 @@ class Node:
     # Dynamic state — changes as the sim runs
     current_status: NodeStatus = NodeStatus.OPERATIONAL
 
+    # Serialised form returned by to_dict(); cleared whenever a field changes
+    _dict_cache: dict | None = field(default=None, init=False, repr=False, compare=False)
+    # Bumped on every change, so to_dict() can tell that a write raced its build
+    _generation: int = field(default=0, init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        # Handles nodes loaded from JSON as plain dicts
-        self.services_running = [
-            Service(**s) if isinstance(s, dict) else s
-            for s in self.services_running
-        ]
-        self.vulnerabilities = [
+        # Low-cardinality label repeated across many nodes: share one string
+        self.node_type = sys.intern(self.node_type)
+
+        # Handles nodes built from plain JSON dicts. Lists are either all dicts
+        # or all objects, so only the first item is checked and a list of
+        # objects is kept as is.
+        services = self.services_running
+        if services and isinstance(services[0], dict):
+            self.services_running = [Service.intern(**s) for s in services]
+        vulns = self.vulnerabilities
+        if vulns and isinstance(vulns[0], dict):
+            self.vulnerabilities = [Vulnerability(**v) for v in vulns]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Node':
+        """
+        Fast constructor for the scenario loader. Writes the slots directly
+        instead of going through __init__, which would bind every keyword
+        and run the cache-invalidating __setattr__ once per field.
+        """
+        # Node(**data) rejected misspelt keys; keep that for scenario typos
+        unknown = data.keys() - _FROM_DICT_KEYS
+        if unknown:
+            raise TypeError(f"Node.from_dict() got unexpected field(s): {', '.join(sorted(unknown))}")
+
+        node = object.__new__(cls)
+        init = object.__setattr__
+        for name, default in _SCALAR_FIELDS:
+            value = data.get(name, default)
+            if value is MISSING:
+                raise TypeError(f"Node.from_dict() missing required field '{name}'")
+            init(node, name, value)
+
+        init(node, 'node_type', sys.intern(node.node_type))
+        if isinstance(node.current_status, str):
+            init(node, 'current_status', NodeStatus[node.current_status])
+        init(node, 'services_running', [
+            Service.intern(**s) if isinstance(s, dict) else s
+            for s in data.get('services_running', ())
+        ])
+        init(node, 'vulnerabilities', [
             Vulnerability(**v) if isinstance(v, dict) else v
-            for v in self.vulnerabilities
-        ]
+            for v in data.get('vulnerabilities', ())
+        ])
+        init(node, '_dict_cache', None)
+        init(node, '_generation', 0)
+        return node
+
+    def clone(self) -> 'Node':
+        """
+        Returns a copy with its own vulnerability objects, whose flags change
+        during play. Services are frozen, so they are shared.
+        """
+        node = object.__new__(type(self))
+        init = object.__setattr__
+        for name, _ in _SCALAR_FIELDS:
+            init(node, name, getattr(self, name))
+        init(node, 'services_running', list(self.services_running))
+        init(node, 'vulnerabilities', [replace(v) for v in self.vulnerabilities])
+        # Same field values, so the cached dict (never mutated) is still valid
+        init(node, '_dict_cache', self._dict_cache)
+        init(node, '_generation', 0)
+        return node
+
+    def __setattr__(self, name, value):
+        # Any field assignment invalidates the cached to_dict() output. The
+        # generation is bumped before the cache is cleared (see to_dict).
+        object.__setattr__(self, name, value)
+        if name not in _CACHE_SLOTS:
+            # getattr: __init__ assigns the fields before _generation exists
+            object.__setattr__(self, '_generation', getattr(self, '_generation', 0) + 1)
+            object.__setattr__(self, '_dict_cache', None)
+
+    def mark_dirty(self):
+        """
+        Drops the cached to_dict() output. Needed only when nested objects
+        (e.g. a Vulnerability's flags) are mutated in place.
+        """
+        object.__setattr__(self, '_generation', self._generation + 1)
+        object.__setattr__(self, '_dict_cache', None)
 
     def to_dict(self):
-        """Returns a JSON-serialisable dict. Converts Enum to string."""
-        d = asdict(self)
-        d['current_status'] = self.current_status.name
-        return d
\ No newline at end of file
+        """
+        Returns a JSON-serialisable dict. Converts Enum to string.
+        The dict is cached until the node changes, so callers must not mutate it.
+        """
+        cached = self._dict_cache
+        if cached is not None:
+            return cached
+        # The API thread serialises while the sim thread writes. If a write
+        # lands while the dict is built, the dict may hold old values, so it
+        # is un-cached again; a write after the re-check clears it itself.
+        generation = self._generation
+        data = {
+            "id": self.id,
+            "name": self.name,
+            "node_type": self.node_type,
+            "services_running": [s.to_dict() for s in self.services_running],
+            "vulnerabilities": [v.to_dict() for v in self.vulnerabilities],
+            "security_posture_score": self.security_posture_score,
+            "detection_chance_modifier": self.detection_chance_modifier,
+            "value": self.value,
+            "c2_resource_generation_rate": self.c2_resource_generation_rate,
+            "exposed_to_internet": self.exposed_to_internet,
+            "has_admin_users": self.has_admin_users,
+            "smb_enabled": self.smb_enabled,
+            "rdp_enabled": self.rdp_enabled,
+            "current_status": self.current_status.name,
+        }
+        object.__setattr__(self, '_dict_cache', data)
+        if self._generation != generation:
+            object.__setattr__(self, '_dict_cache', None)
+        return data
+
+    def to_dynamic_dict(self):
+        """The fields that change during a run, for per-tick delta updates."""
+        return {
+            "id": self.id,
+            "current_status": self.current_status.name,
+            "detection_chance_modifier": self.detection_chance_modifier,
+        }
+
+
+# Bookkeeping slots whose assignment must not invalidate the to_dict() cache
+_CACHE_SLOTS = frozenset(('_dict_cache', '_generation'))
+
+# (name, default) for every plain-valued init field, read by Node.from_dict
+_SCALAR_FIELDS = tuple(
+    (f.name, f.default)
+    for f in fields(Node)
+    if f.init and f.default_factory is MISSING
+)
+
+# Every key Node.from_dict accepts: the scalar fields plus the two lists
+_FROM_DICT_KEYS = frozenset(name for name, _ in _SCALAR_FIELDS) | {'services_running', 'vulnerabilities'}
@@ -1,13 +1,35 @@
 # backend/simulation/objects/service.py
 
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Service:
     """Represents a running service or application on a node."""
     id: str  # e.g., "HTTP_Web_Server", "SSH_Access"
     protocol: str  # e.g., "TCP/80", "TCP/22"
 
+    def __post_init__(self):
+        # Share the handful of protocol strings used across all nodes
+        object.__setattr__(self, 'protocol', sys.intern(self.protocol))
+
+    @classmethod
+    def intern(cls, id: str, protocol: str) -> 'Service':
+        """
+        Returns the shared Service for (id, protocol), creating it on first use.
+        Services are immutable, so every node running the same one can share it.
+        """
+        key = (id, protocol)
+        service = _SERVICES.get(key)
+        if service is None:
+            service = _SERVICES[key] = cls(id, protocol)
+        return service
+
     def to_dict(self):
         """Converts the dataclass to a dictionary."""
-        return asdict(self)
\ No newline at end of file
+        return {"id": self.id, "protocol": self.protocol}
+
+
+# (id, protocol) -> shared Service, filled by Service.intern. Bounded by the
+# distinct services across loaded scenarios, so it is never pruned.
+_SERVICES: dict = {}
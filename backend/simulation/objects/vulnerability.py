@@ -1,6 +1,6 @@
 # backend/simulation/objects/vulnerability.py
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass
 from enum import Enum, auto
 
 class PatchStatus(Enum):
@@ -8,7 +8,10 @@ class PatchStatus(Enum):
     PATCHED = auto()
     MITIGATION_APPLIED = auto()
 
-@dataclass
+# Name -> member lookup for decoding scenario JSON, built once at import
+_PATCH_STATUS_BY_NAME = {status.name: status for status in PatchStatus}
+
+@dataclass(slots=True)
 class Vulnerability:
     """Represents a weakness on a node or service."""
     cve_id: str  # e.g., "CVE-2023-1234"
@@ -20,8 +23,18 @@ class Vulnerability:
     patch_status: PatchStatus = PatchStatus.UNPATCHED
     known_to_blue: bool = False
 
+    def __post_init__(self):
+        # Scenario JSON carries the status by name; decode it with a plain dict hit
+        if isinstance(self.patch_status, str):
+            self.patch_status = _PATCH_STATUS_BY_NAME[self.patch_status]
+
     def to_dict(self):
         """Converts the dataclass to a dictionary, handling Enum types."""
-        d = asdict(self)
-        d['patch_status'] = self.patch_status.name
-        return d
\ No newline at end of file
+        return {
+            "cve_id": self.cve_id,
+            "service_id": self.service_id,
+            "exploitability": self.exploitability,
+            "severity": self.severity,
+            "patch_status": self.patch_status.name,
+            "known_to_blue": self.known_to_blue,
+        }
\ No newline at end of file
@@ -1,8 +1,14 @@
 # backend/simulation/state_manager.py
 
-from typing import Any, Dict
+import logging
+import random
+import threading
+from typing import Any, Callable, Dict
+from backend.actions.base_action import Team
 from backend.simulation.objects.network_graph import NetworkGraph
 
+logger = logging.getLogger(__name__)
+
 
 class StateManager:
     """
@@ -10,12 +16,34 @@ class StateManager:
     Every action reads from and writes to this object.
     """
 
+    # (GUI label, attribute name) for every per-node kill chain stage, in order.
+    # Resolved once per snapshot instead of once per node.
+    KILL_CHAIN_STAGES = (
+        ("PORT_SCANNED",   "port_scanned_nodes"),
+        ("FINGERPRINTED",  "fingerprinted_nodes"),
+        ("INITIAL_ACCESS", "initial_access_nodes"),
+        ("PRIVILEGED",     "privileged_nodes"),
+        ("CREDS_DUMPED",   "credential_stores"),
+        ("LATERAL",        "lateral_access_nodes"),
+        ("EVASION",        "evasion_active_nodes"),
+        ("C2",             "c2_nodes"),
+        ("DATA_STAGED",    "staged_data_nodes"),
+    )
+
     def __init__(self):
         self.network_graph: NetworkGraph | None = None
         self.red_resources: float = 100.0
         self.blue_resources: float = 100.0
         self.is_running: bool = False
 
+        # The one RNG every action roll and AI shuffle draws from, so a seeded
+        # reset replays the same run without touching the global random module.
+        self.rng = random.Random()
+
+        # One lock per team so Red and Blue spending never contend with each
+        # other once agents run on separate threads.
+        self._resource_locks = {Team.RED: threading.Lock(), Team.BLUE: threading.Lock()}
+
         # --- Kill chain tracking ---
         # Each set holds node IDs that have reached that stage.
         # Actions write to these on success.
@@ -39,12 +67,32 @@ class StateManager:
         # The GUI event feed will consume this.
         self.kill_chain_log: list = []
 
-        print("DEBUG: StateManager initialized.")
+        # Raw EventBus events recorded for the GUI (see record_event).
+        self.recent_events: list = []
+
+        # Seed of the last seeded reset. Reused by later resets that do not
+        # pass one, so a seeded run stays reproducible across Reset clicks.
+        self._last_seed: int | None = None
+
+        # Optional observer for node attribute changes, called as
+        # sink(node_id, attribute, old_value, new_value). None when no history
+        # is being recorded, which keeps update_node_attribute to one check.
+        self._history_sink: Callable[[str, str, Any, Any], None] | None = None
+
+        # Change counter for delta polling (see node_changes_since). Bumped on
+        # every node mutation; _node_versions maps node_id -> counter value of
+        # its last change. A reset replaces every node at once, which
+        # is recorded as _full_sync_version instead of per node.
+        self._state_version: int = 0
+        self._full_sync_version: int = 0
+        self._node_versions: Dict[str, int] = {}
+
+        logger.debug("StateManager initialized.")
 
     def record_kill_chain_event(self, tactic: str, technique: str, node_id: str, detail: str = ""):
         """
         Called by every action on success or failure.
-        Appends a structured entry to the log and prints a clear console marker.
+        Appends a structured entry to the log and logs a clear console marker.
         """
         entry = {
             "tactic": tactic,
@@ -53,14 +101,13 @@ class StateManager:
             "detail": detail
         }
         self.kill_chain_log.append(entry)
-        print(f"[KILL CHAIN] {tactic} | {technique} -> {node_id}  {detail}")
+        # Lazy %-formatting: nothing is formatted when INFO is disabled.
+        logger.info("[KILL CHAIN] %s | %s -> %s  %s", tactic, technique, node_id, detail)
 
     # --- Serialisation for WebSocket broadcast ---
 
     def record_event(self, event_type: str, payload: dict):
         """Called by the API EventBus hook to store raw events for the GUI."""
-        if not hasattr(self, 'recent_events'):
-            self.recent_events: list = []
         self.recent_events.append({"event_type": event_type, "payload": payload})
 
     def to_dict(self, sim_time: float = 0.0) -> Dict[str, Any]:
@@ -70,19 +117,10 @@ class StateManager:
         # Build a per-node kill chain progress summary
         kill_chain_progress = {}
         if self.network_graph:
+            stage_sets = [(label, getattr(self, attr)) for label, attr in self.KILL_CHAIN_STAGES]
             for node in self.network_graph.get_all_nodes():
                 nid = node.id
-                stages = []
-                if nid in self.port_scanned_nodes:    stages.append("PORT_SCANNED")
-                if nid in self.fingerprinted_nodes:   stages.append("FINGERPRINTED")
-                if nid in self.initial_access_nodes:  stages.append("INITIAL_ACCESS")
-                if nid in self.privileged_nodes:       stages.append("PRIVILEGED")
-                if nid in self.credential_stores:      stages.append("CREDS_DUMPED")
-                if nid in self.lateral_access_nodes:   stages.append("LATERAL")
-                if nid in self.evasion_active_nodes:   stages.append("EVASION")
-                if nid in self.c2_nodes:               stages.append("C2")
-                if nid in self.staged_data_nodes:      stages.append("DATA_STAGED")
-                kill_chain_progress[nid] = stages
+                kill_chain_progress[nid] = [label for label, members in stage_sets if nid in members]
 
         return {
             "sim_time": sim_time,
@@ -93,40 +131,121 @@ class StateManager:
             "kill_chain_progress": kill_chain_progress,
             "exfil_complete": self.exfil_complete,
             "kill_chain_log": self.kill_chain_log[-50:],
-            "recent_events": getattr(self, 'recent_events', []),
+            "recent_events": self.recent_events,
         }
 
+    # --- Node mutation ---
+
+    def set_history_sink(self, sink: Callable[[str, str, Any, Any], None] | None):
+        """Installs (or with None, removes) the node attribute change observer."""
+        self._history_sink = sink
+
+    def update_node_attribute(self, node_id: str, attribute: str, value: Any):
+        """
+        Sets a dynamic attribute on a node. Every in-simulation node mutation
+        goes through here so history recording has a single hook point.
+        The old value is only read when a history sink is installed.
+        """
+        node = self.network_graph.get_node_by_id(node_id)
+        if node is None:
+            return
+        if self._history_sink is not None:
+            self._history_sink(node_id, attribute, getattr(node, attribute), value)
+        setattr(node, attribute, value)
+        self._state_version += 1
+        self._node_versions[node_id] = self._state_version
+
+    def _mark_all_nodes_changed(self):
+        self._state_version += 1
+        self._full_sync_version = self._state_version
+        self._node_versions = {}
+
+    def node_changes_since(self, version: int) -> tuple[int, list]:
+        """
+        Returns (current version, dynamic dicts of the nodes changed after
+        version). Pass the returned version back to receive only newer changes;
+        a version from before the last reset gets every node.
+        """
+        current = self._state_version
+        if not self.network_graph:
+            return current, []
+        if version < self._full_sync_version:
+            nodes = self.network_graph.get_all_nodes()
+        else:
+            # list() snapshots the dict in one step; the sim thread may be writing
+            get_node = self.network_graph.get_node_by_id
+            nodes = [get_node(nid) for nid, v in list(self._node_versions.items()) if v > version]
+        return current, [node.to_dynamic_dict() for node in nodes]
+
+    # --- Team resources ---
+
+    def get_resources(self, team: Team) -> float:
+        """Returns the current resource pool of a team."""
+        return self.red_resources if team == Team.RED else self.blue_resources
+
+    def spend_resources(self, team: Team, cost: float) -> bool:
+        """
+        Deducts cost from a team's pool if it can afford it.
+        The check and the deduction happen under that team's lock only.
+        Returns True if the resources were spent.
+        """
+        with self._resource_locks[team]:
+            if team == Team.RED:
+                if self.red_resources < cost:
+                    return False
+                self.red_resources -= cost
+            else:
+                if self.blue_resources < cost:
+                    return False
+                self.blue_resources -= cost
+        return True
+
+    def add_resources(self, team: Team, amount: float):
+        """Credits amount to a team's pool under that team's lock."""
+        with self._resource_locks[team]:
+            if team == Team.RED:
+                self.red_resources += amount
+            else:
+                self.blue_resources += amount
+
     def get_owned_nodes(self) -> set:
         """
         Returns all node IDs that Red currently has any level of access to.
         Used by the AI to find pivot points for lateral movement.
         """
-        return (
-            self.initial_access_nodes |
-            self.privileged_nodes |
-            self.lateral_access_nodes |
-            self.c2_nodes
+        # A single union() call builds one result set instead of three intermediates.
+        return self.initial_access_nodes.union(
+            self.privileged_nodes,
+            self.lateral_access_nodes,
+            self.c2_nodes,
         )
 
     def load_scenario(self, scenario_path: str):
         """Loads a network graph from a scenario JSON file."""
-        print(f"DEBUG: StateManager loading scenario from {scenario_path}...")
+        logger.debug("StateManager loading scenario from %s...", scenario_path)
         try:
             self.network_graph = NetworkGraph.load_from_json(scenario_path)
-            print("DEBUG: Scenario loaded successfully.")
+            logger.debug("Scenario loaded successfully.")
         except FileNotFoundError:
-            print(f"ERROR: Scenario file not found at {scenario_path}")
+            logger.error("Scenario file not found at %s", scenario_path)
             self.network_graph = NetworkGraph()
         except Exception as e:
-            print(f"ERROR: Failed to load scenario: {e}")
+            logger.error("Failed to load scenario: %s", e)
             self.network_graph = NetworkGraph()
 
-    def reset(self, scenario_path: str):
+    def reset(self, scenario_path: str, seed: int | None = None):
         """
         Wipes all state and reloads a fresh scenario.
         Call this at the start of every new simulation run.
+        If seed is None, the seed of the last seeded reset (if any) is reused.
         """
-        print("DEBUG: StateManager resetting state...")
+        logger.debug("StateManager resetting state...")
+        if seed is None:
+            seed = self._last_seed
+        if seed is not None:
+            self.rng.seed(seed)
+            self._last_seed = seed
+
         self.load_scenario(scenario_path)
 
         self.red_resources = 100.0
@@ -147,5 +266,6 @@ class StateManager:
         self.exfil_complete = False
         self.kill_chain_log = []
         self.recent_events = []
+        self._mark_all_nodes_changed()
 
-        print("DEBUG: StateManager has been reset.")
\ No newline at end of file
+        logger.debug("StateManager has been reset.")
\ No newline at end of file
@@ -1,9 +1,12 @@
 # backend/simulation/time_manager.py
 
 import heapq
+import logging
 import time
 from typing import Callable, Any
 
+logger = logging.getLogger(__name__)
+
 class TimeManager:
     """
     Manages the continuous, asynchronous simulation clock and schedules future events.
@@ -13,20 +16,59 @@ class TimeManager:
         # Min-heap of (event_time, unique_id, callback_function, *args, **kwargs) tuples
         self.event_queue: list[tuple[float, int, Callable, tuple, dict]] = []
         self._next_id: int = 0
+        # IDs of cancelled events still sitting in event_queue (tombstones)
+        self._cancelled: set[int] = set()
         self._is_paused: bool = False
         self._simulation_speed: float = 1.0
 
-    def schedule_event(self, callback: Callable, delay: float, *args, **kwargs):
-        """Schedules callback to run delay units from current_time."""
+    def schedule_event(self, callback: Callable, delay: float, *args, **kwargs) -> int:
+        """Schedules callback to run delay units from current_time. Returns the event ID."""
         event_time = self.current_time + delay
-        heapq.heappush(self.event_queue, (event_time, self._next_id, callback, args, kwargs))
+        event_id = self._next_id
+        heapq.heappush(self.event_queue, (event_time, event_id, callback, args, kwargs))
         self._next_id += 1
+        return event_id
+
+    def schedule_events(self, callback: Callable, delays, *args) -> list[int]:
+        """
+        Schedules callback(*args) once per delay in delays, e.g. one heartbeat
+        per node. The batch is appended and the heap rebuilt once, instead of
+        one heappush per event. Returns the event IDs in the order of delays.
+        """
+        base_time = self.current_time
+        first_id = self._next_id
+        new_events = [
+            (base_time + delay, first_id + i, callback, args, {})
+            for i, delay in enumerate(delays)
+        ]
+        self._next_id += len(new_events)
+        self.event_queue.extend(new_events)
+        heapq.heapify(self.event_queue)
+        return list(range(first_id, self._next_id))
+
+    def cancel_event(self, event_id: int):
+        """
+        Cancels a scheduled event by the ID schedule_event returned. The entry
+        is left in the heap and skipped when popped; the heap is rebuilt
+        without tombstones once they make up a quarter of it.
+        """
+        self._cancelled.add(event_id)
+        if len(self._cancelled) * 4 >= len(self.event_queue):
+            # In place: process_events_until holds local references to both
+            cancelled = self._cancelled
+            self.event_queue[:] = [e for e in self.event_queue if e[1] not in cancelled]
+            heapq.heapify(self.event_queue)
+            # Also drops IDs of events that had already run or never existed
+            cancelled.clear()
 
     def next_event_time(self) -> float | None:
         """Returns time of the next scheduled event without removing it."""
-        if not self.event_queue:
+        queue = self.event_queue
+        while queue and queue[0][1] in self._cancelled:
+            self._cancelled.discard(heapq.heappop(queue)[1])
+        if not queue:
             return None
-        return self.event_queue[0][0]
+        return queue[0][0]
 
     def process_events_until(self, target_time: float):
         """
@@ -36,21 +78,29 @@ class TimeManager:
         if self._is_paused:
             return
 
-        events_to_execute = []
-        while self.event_queue and self.event_queue[0][0] <= target_time:
-            event_time, _, callback, args, kwargs = heapq.heappop(self.event_queue)
-            events_to_execute.append((event_time, callback, args, kwargs))
-
-        for event_time, callback, args, kwargs in events_to_execute:
+        # Pop and run one event at a time, so events a callback schedules or
+        # cancels within this window are honoured in time order.
+        queue = self.event_queue
+        cancelled = self._cancelled
+        heappop = heapq.heappop
+        while queue and queue[0][0] <= target_time:
+            event_time, event_id, callback, args, kwargs = heappop(queue)
+            if event_id in cancelled:
+                cancelled.discard(event_id)
+                continue
             # Update current_time to the time of the event being executed
             self.current_time = event_time
             try:
-                callback(*args, **kwargs)
+                if kwargs:
+                    callback(*args, **kwargs)
+                else:
+                    callback(*args)
             except Exception as e:
-                print(f"\nERROR: Callback '{callback.__name__}' failed during execution: {e}")
+                logger.error("Callback '%s' failed during execution: %s", callback.__name__, e)
 
         # After processing all due events, set current_time to the target_time
-        self.current_time = max(self.current_time, target_time)
+        if target_time > self.current_time:
+            self.current_time = target_time
 
     def set_speed(self, speed: float):
         """Sets the simulation speed multiplier."""
@@ -79,5 +129,6 @@ class TimeManager:
         self.current_time = initial_time
         self.event_queue = []
         self._next_id = 0
+        self._cancelled = set()
         self._is_paused = False
         self._simulation_speed = 1.0
\ No newline at end of file
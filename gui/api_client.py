@@ -1,35 +1,20 @@
 # gui/api_client.py
 
 import json
+import queue
 import asyncio
 import threading
 import requests
 import websockets
 
-from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
-
-
-# ---------------------------------------------------------------------------
-# Worker — runs a plain function in Qt's thread pool (used for HTTP calls)
-# ---------------------------------------------------------------------------
-class Worker(QRunnable):
-    def __init__(self, fn, *args, **kwargs):
-        super().__init__()
-        self.fn = fn
-        self.args = args
-        self.kwargs = kwargs
-
-    def run(self):
-        try:
-            self.fn(*self.args, **self.kwargs)
-        except Exception as e:
-            print(f"Error in worker thread: {e}")
+from PySide6.QtCore import QObject, Signal
 
 
 # ---------------------------------------------------------------------------
 # APIClient
 # Handles all communication with the FastAPI backend:
-#   - HTTP POST requests for control commands (start, pause, reset, speed)
+#   - HTTP POST requests for control commands (start, pause, reset, speed),
+#     queued and sent in order by a single background thread
 #   - A persistent WebSocket connection that receives state snapshots
 #     and emits them as a Qt signal so the GUI can react
 # ---------------------------------------------------------------------------
@@ -43,7 +28,13 @@ class APIClient(QObject):
     def __init__(self, base_url="http://127.0.0.1:8000"):
         super().__init__()
         self.base_url = base_url
-        self.thread_pool = QThreadPool()
+        # One session for all control commands, so requests reuse a
+        # keep-alive connection instead of opening a new one per click
+        self.session = requests.Session()
+        # (kind, endpoint) control commands, drained by _consume_commands
+        self._cmd_q: queue.Queue = queue.Queue(maxsize=128)
+        self._cmd_thread = threading.Thread(target=self._consume_commands, daemon=True)
+        self._cmd_thread.start()
         self._ws_thread = None
         print(f"APIClient initialized for base URL: {self.base_url}")
 
@@ -104,26 +95,55 @@ class APIClient(QObject):
         try:
             url = f"{self.base_url}{endpoint}"
             print(f"APIClient: Sending POST to {url}...")
-            response = requests.post(url, timeout=5)
+            response = self.session.post(url, timeout=5)
             response.raise_for_status()
             print(f"APIClient: POST to {endpoint} succeeded.")
         except requests.exceptions.ConnectionError:
             print(f"APIClient: Could not connect to backend at {self.base_url}.")
         except requests.exceptions.RequestException as e:
             print(f"APIClient: Request failed: {e}")
+        except Exception as e:
+            # Anything else must not escape: it would end the command thread
+            # and every later command would queue up unsent.
+            print(f"APIClient: Unexpected error sending POST to {endpoint}: {e}")
+
+    def _enqueue(self, kind: str, endpoint: str):
+        try:
+            self._cmd_q.put_nowait((kind, endpoint))
+        except queue.Full:
+            print(f"APIClient: Command queue full, dropping {kind} command.")
 
-    def _execute_in_thread(self, endpoint: str):
-        worker = Worker(self._send_post_request, endpoint)
-        self.thread_pool.start(worker)
+    def _consume_commands(self):
+        """
+        Runs on the command thread: sends queued commands one at a time, in
+        the order they were issued. A backlog of speed changes collapses into
+        the latest one, since only the final speed matters.
+        """
+        while True:
+            kind, endpoint = self._cmd_q.get()
+            follow_up = None
+            if kind == "speed":
+                while True:
+                    try:
+                        next_kind, next_endpoint = self._cmd_q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if next_kind != "speed":
+                        follow_up = next_endpoint
+                        break
+                    endpoint = next_endpoint
+            self._send_post_request(endpoint)
+            if follow_up is not None:
+                self._send_post_request(follow_up)
 
     def start_simulation(self):
-        self._execute_in_thread("/api/simulation/start")
+        self._enqueue("start", "/api/simulation/start")
 
     def pause_simulation(self):
-        self._execute_in_thread("/api/simulation/pause")
+        self._enqueue("pause", "/api/simulation/pause")
 
     def reset_simulation(self):
-        self._execute_in_thread("/api/simulation/reset/corporate_network")
+        self._enqueue("reset", "/api/simulation/reset/corporate_network")
 
     def set_simulation_speed(self, speed: float):
-        self._execute_in_thread(f"/api/simulation/speed/{speed}")
\ No newline at end of file
+        self._enqueue("speed", f"/api/simulation/speed/{speed}")
\ No newline at end of file
@@ -450,6 +450,14 @@ class ControlBar(QWidget):
         self._slider.setFixedWidth(120)
         self._slider.valueChanged.connect(self._on_speed_change)
 
+        # A drag emits valueChanged for every step it crosses; only the speed
+        # the slider settles on for 150 ms is sent to the backend.
+        self._pending_speed = 1
+        self._speed_timer = QTimer(self)
+        self._speed_timer.setSingleShot(True)
+        self._speed_timer.setInterval(150)
+        self._speed_timer.timeout.connect(self._send_speed)
+
         slider_row.addWidget(self._speed_label)
         slider_row.addWidget(self._slider)
 
@@ -611,7 +619,11 @@ class ControlBar(QWidget):
         speed_map = {0: 0.5, 1: 1, 2: 2, 3: 5, 4: 10}
         speed = speed_map.get(value, 1)
         self._speed_label.setText(f"{speed}×")
-        self._api.set_simulation_speed(speed)
+        self._pending_speed = speed
+        self._speed_timer.start()
+
+    def _send_speed(self):
+        self._api.set_simulation_speed(self._pending_speed)
 
     def _on_reset(self):
         """Fix 5: Reset the backend AND clear all UI state."""
@@ -1,19 +1,30 @@
 # gui/widgets/simulation_controls.py
 
+import logging
+
 from PySide6.QtWidgets import (
-    QWidget, QPushButton, QSlider, QLabel, QHBoxLayout, QVBoxLayout, QGroupBox
+    QPushButton, QSlider, QLabel, QHBoxLayout, QVBoxLayout, QGroupBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
+
+logger = logging.getLogger(__name__)
 
-class SimulationControlsWidget(QWidget):
+# The widget is the group box itself rather than a QWidget wrapping one,
+# which saves a widget and a layout level.
+class SimulationControlsWidget(QGroupBox):
     start_clicked = Signal()
     pause_clicked = Signal()
     reset_clicked = Signal()
     speed_changed = Signal(float)
 
+    # Speed multiplier and label text for each slider position (0..4)
+    # Floats throughout, matching speed_changed = Signal(float). Labels use
+    # :g so every stop reads the same way ("0.5x", "1x", "10x").
+    _SPEEDS = (0.5, 1.0, 2.0, 5.0, 10.0)
+    _SPEED_LABELS = tuple(f"Speed: {speed:g}x" for speed in _SPEEDS)
+
     def __init__(self, parent=None):
-        super().__init__(parent)
-        group_box = QGroupBox("Simulation Controls")
+        super().__init__("Simulation Controls", parent)
         self.start_button = QPushButton("Start")
         self.pause_button = QPushButton("Pause")
         self.reset_button = QPushButton("Reset")
@@ -21,11 +32,9 @@ class SimulationControlsWidget(QWidget):
         self.speed_slider.setMinimum(0)
         self.speed_slider.setMaximum(4)
         self.speed_slider.setValue(1)
-        self.speed_slider.setTickPosition(QSlider.TicksBelow)
-        self.speed_slider.setTickInterval(1)
         self.speed_label = QLabel("Speed: 1x")
         self.speed_label.setAlignment(Qt.AlignCenter)
-        main_layout = QVBoxLayout()
+        main_layout = QVBoxLayout(self)
         button_layout = QHBoxLayout()
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.pause_button)
@@ -37,32 +46,33 @@ class SimulationControlsWidget(QWidget):
         main_layout.addLayout(button_layout)
         main_layout.addLayout(slider_layout)
         main_layout.addWidget(self.speed_label)
-        group_box.setLayout(main_layout)
-        final_layout = QVBoxLayout()
-        final_layout.addWidget(group_box)
-        self.setLayout(final_layout)
         
-        self.start_button.clicked.connect(self.on_start)
-        self.pause_button.clicked.connect(self.on_pause)
-        self.reset_button.clicked.connect(self.on_reset)
+        # Signal-to-signal connections: Qt forwards the clicks in C++
+        self.start_button.clicked.connect(self.start_clicked)
+        self.pause_button.clicked.connect(self.pause_clicked)
+        self.reset_button.clicked.connect(self.reset_clicked)
         self.speed_slider.valueChanged.connect(self.on_speed_change)
 
-    def on_start(self):
-        # --- TRACER ---
-        print("[1] SimulationControlsWidget: 'Start' button clicked. Emitting start_clicked signal.")
-        self.start_clicked.emit()
-
-    def on_pause(self):
-        print("[1] SimulationControlsWidget: 'Pause' button clicked. Emitting pause_clicked signal.")
-        self.pause_clicked.emit()
-
-    def on_reset(self):
-        print("[1] SimulationControlsWidget: 'Reset' button clicked. Emitting reset_clicked signal.")
-        self.reset_clicked.emit()
+        # A drag emits valueChanged for every step it crosses; speed_changed
+        # fires once the slider settles, and only if the speed really changed.
+        self._last_emitted_speed = 1.0
+        self._pending_speed = 1.0
+        self._speed_timer = QTimer(self)
+        self._speed_timer.setSingleShot(True)
+        self._speed_timer.setInterval(150)
+        self._speed_timer.timeout.connect(self._emit_pending_speed)
 
     def on_speed_change(self, value):
-        speed_map = {0: 0.5, 1: 1, 2: 2, 3: 5, 4: 10}
-        speed_value = speed_map.get(value, 1)
-        self.speed_label.setText(f"Speed: {speed_value}x")
-        print(f"[1] SimulationControlsWidget: Speed changed. Emitting speed_changed signal with value {speed_value}.")
-        self.speed_changed.emit(speed_value)
\ No newline at end of file
+        text = self._SPEED_LABELS[value]
+        # setText relayouts the label even when the text is unchanged
+        if self.speed_label.text() != text:
+            self.speed_label.setText(text)
+        self._pending_speed = self._SPEEDS[value]
+        self._speed_timer.start()
+
+    def _emit_pending_speed(self):
+        if self._pending_speed == self._last_emitted_speed:
+            return
+        self._last_emitted_speed = self._pending_speed
+        logger.debug("SimulationControlsWidget: Speed changed. Emitting speed_changed signal with value %s.", self._pending_speed)
+        self.speed_changed.emit(self._pending_speed)
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+TimeManager event cancellation and batch scheduling.
+
+Run from the repository root:  python -m unittest discover -s tests -t .
+"""
+import heapq
+import unittest
+
+from backend.simulation.time_manager import TimeManager
+
+
+class CancelEventTest(unittest.TestCase):
+    def setUp(self):
+        self.tm = TimeManager()
+        self.fired = []
+
+    def _record(self, label):
+        self.fired.append(label)
+
+    def test_cancelled_event_never_fires(self):
+        self.tm.schedule_event(self._record, 1.0, "a")
+        b = self.tm.schedule_event(self._record, 2.0, "b")
+        self.tm.schedule_event(self._record, 3.0, "c")
+        self.tm.cancel_event(b)
+        self.tm.process_events_until(10.0)
+        self.assertEqual(self.fired, ["a", "c"])
+
+    def test_next_event_time_skips_tombstones(self):
+        first = self.tm.schedule_event(self._record, 1.0, "a")
+        for delay in (2.0, 3.0, 4.0, 5.0, 6.0):
+            self.tm.schedule_event(self._record, delay, "x")
+        # One tombstone in six stays below the compaction threshold
+        self.tm.cancel_event(first)
+        self.assertIn(first, self.tm._cancelled)
+        self.assertEqual(self.tm.next_event_time(), 2.0)
+        self.assertNotIn(first, self.tm._cancelled)
+
+    def test_compaction_at_quarter_tombstones_keeps_order(self):
+        ids = [self.tm.schedule_event(self._record, float(t), t) for t in (8, 3, 6, 1, 7, 2, 5, 4)]
+        queue = self.tm.event_queue
+
+        self.tm.cancel_event(ids[1])  # t=3; 1 of 8, below a quarter
+        self.assertEqual(len(queue), 8)
+
+        self.tm.cancel_event(ids[4])  # t=7; 2 of 8 reaches a quarter
+        self.assertIs(self.tm.event_queue, queue)  # rebuilt in place
+        self.assertEqual(len(queue), 6)
+        self.assertEqual(self.tm._cancelled, set())
+        self.assertEqual([e[0] for e in heapq.nsmallest(6, queue)], [1.0, 2.0, 4.0, 5.0, 6.0, 8.0])
+
+        self.tm.process_events_until(10.0)
+        self.assertEqual(self.fired, [1, 2, 4, 5, 6, 8])
+
+    def test_cancel_from_running_callback(self):
+        later = []
+
+        def cancel_later():
+            self.fired.append("canceller")
+            # Two queued events, one tombstone: compacts mid-dispatch
+            self.tm.cancel_event(later[0])
+
+        self.tm.schedule_event(cancel_later, 1.0)
+        later.append(self.tm.schedule_event(self._record, 2.0, "cancelled"))
+        self.tm.schedule_event(self._record, 3.0, "kept")
+
+        self.tm.process_events_until(10.0)
+        self.assertEqual(self.fired, ["canceller", "kept"])
+        self.assertEqual(self.tm.event_queue, [])
+
+
+class ScheduleEventsTest(unittest.TestCase):
+    def setUp(self):
+        self.tm = TimeManager()
+        self.fired = []
+
+    def _record_time(self):
+        self.fired.append(self.tm.current_time)
+
+    def test_ids_follow_input_order_and_cancel_individually(self):
+        delays = [5.0, 1.0, 3.0, 2.0]
+        ids = self.tm.schedule_events(self._record_time, delays)
+        time_of = {event_id: event_time for event_time, event_id, *_ in self.tm.event_queue}
+        self.assertEqual([time_of[i] for i in ids], delays)
+
+        self.tm.cancel_event(ids[2])  # the 3.0 event only
+        self.tm.process_events_until(10.0)
+        self.assertEqual(self.fired, [1.0, 2.0, 5.0])
+
+    def test_equal_times_fire_in_insertion_order(self):
+        self.tm.schedule_event(self.fired.append, 1.0, "single")
+        ids = self.tm.schedule_events(self.fired.append, [1.0, 1.0, 1.0], "batch")
+        self.tm.schedule_event(self.fired.append, 1.0, "after")
+
+        # heapify breaks the time tie on the event ID, i.e. insertion order
+        queue = list(self.tm.event_queue)
+        popped = [heapq.heappop(queue)[1] for _ in range(len(queue))]
+        self.assertEqual(popped[1:4], ids)
+
+        self.tm.process_events_until(1.0)
+        self.assertEqual(self.fired, ["single", "batch", "batch", "batch", "after"])
+
+
+if __name__ == "__main__":
+    unittest.main()